@@ -40,7 +40,7 @@ def create_app():
 
     # Initialize services
     db_service = DatabaseService(db)
-    pinecone_service = PineconeService(app_config)
+    pinecone_service = PineconeService(app_config, db_service)
 
     user_manager = UserManager(db_service)
     auth_manager = AuthManager(db_service, app_config)
@@ -26,8 +26,13 @@ class MyConfig:
     OPENAI_EMBEDDINGS_MODEL = os.getenv(
         "OPENAI_EMBEDDINGS_MODEL", "text-embedding-3-large"
     )
+    OPENAI_EMBEDDINGS_CHUNK_SIZE = int(os.getenv("OPENAI_EMBEDDINGS_CHUNK_SIZE", 1000))
     SYSTEM_PROMPT = os.getenv("SYSTEM_PROMPT", "You are a helpful assistant.")
 
+    # Text splitting Configuration (sizes measured in tokens)
+    TEXT_CHUNK_SIZE = int(os.getenv("TEXT_CHUNK_SIZE", 512))
+    TEXT_CHUNK_OVERLAP = int(os.getenv("TEXT_CHUNK_OVERLAP", 64))
+
     # Pinecone Configuration
     PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
     PINECONE_CLOUD = os.getenv("PINECONE_CLOUD", "aws")
@@ -36,7 +41,15 @@ class MyConfig:
     PINECONE_DIMENSION = int(os.getenv("PINECONE_DIMENSION", 3072))
     PINECONE_METRIC = os.getenv("PINECONE_METRIC", "cosine")
     PINECONE_TOP_K = int(os.getenv("PINECONE_TOP_K", 5))
+    PINECONE_POOL_THREADS = int(os.getenv("PINECONE_POOL_THREADS", 4))
+    PINECONE_UPSERT_BATCH_SIZE = int(os.getenv("PINECONE_UPSERT_BATCH_SIZE", 64))
     PINECONE_SCORE_THRESHOLD = float(os.getenv("PINECONE_SCORE_THRESHOLD", 0.7))
+    CONTEXT_MAX_CHUNKS = int(os.getenv("CONTEXT_MAX_CHUNKS", 4))
+
+    # Semantic query cache Configuration
+    SEMANTIC_CACHE_MAXSIZE = int(os.getenv("SEMANTIC_CACHE_MAXSIZE", 1024))
+    SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL", 300))
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.95))
 
     # Authentication (Simple auth for demo)
     DEFAULT_DB_USERNAME = os.getenv("DEFAULT_DB_USERNAME")
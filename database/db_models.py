@@ -6,7 +6,9 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import (
     func,
+    text,
     Text,
+    Index,
     Column,
     String,
     Boolean,
@@ -62,6 +64,11 @@ class Episode(db.Model):
     """Episode model for podcast episodes"""
 
     __tablename__ = "episodes"
+    __table_args__ = (
+        # Matches the filter + ORDER BY in DatabaseService.get_episodes so
+        # Postgres can serve it as an index range scan without a sort step
+        Index("ix_episode_expert_created", "expert_id", text("created_at DESC")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     expert_id = Column(UUID(as_uuid=True), ForeignKey("experts.id"))
@@ -81,24 +88,32 @@ class Episode(db.Model):
     def __repr__(self):
         return f"<Episode(title='{self.title}')>"
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, include_content: bool = True) -> dict:
+        episode_dict = {
             "id": str(self.id),
             "expertName": self.expert.name,
             "title": self.title,
-            "content": self.content,
             "createdAt": self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
             "updatedAt": self.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
         }
+        if include_content:
+            episode_dict["content"] = self.content
+        return episode_dict
 
 
 class Expert(db.Model):
     """Expert model for custom AI experts created by users"""
 
     __tablename__ = "experts"
+    __table_args__ = (
+        # Matches the filter + ORDER BY in DatabaseService.get_user_experts
+        Index("ix_expert_user_created", "user_id", text("created_at DESC")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    # Globally unique (not per user): the Pinecone namespace is derived from
+    # the name alone, so two users sharing a name would share vectors
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
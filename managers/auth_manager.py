@@ -7,9 +7,22 @@ from typing import Optional, Dict, Any
 from services.db_service import DatabaseService
 from werkzeug.security import check_password_hash
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Password hashing is deliberately CPU-heavy, so verification runs in a small
+# process pool to keep the request worker threads free for I/O
+_hash_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_hash_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared process pool used for password verification."""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ProcessPoolExecutor(max_workers=2)
+    return _hash_executor
+
 
 class AuthManager:
     def __init__(self, db_service: DatabaseService, config: MyConfig):
@@ -21,18 +34,27 @@ class AuthManager:
     ) -> Optional[Dict[str, Any]]:
         """Authenticate user with database credentials"""
         try:
-            user = self.db_service.get_user_by_username(username)
+            auth_view = self.db_service.get_user_auth_view(username)
 
-            if not user or not check_password_hash(user.password_hash, password):
+            password_ok = auth_view is not None and (
+                _get_hash_executor()
+                .submit(check_password_hash, auth_view.password_hash, password)
+                .result()
+            )
+
+            if not password_ok:
                 logger.warning(f"Failed login attempt: {username}")
                 return {
                     "success": False,
                     "error": "Invalid username or password. Please try again.",
                 }
 
-            if not user.is_active:
+            if not auth_view.is_active:
                 return {"success": False, "error": "Account is deactivated"}
 
+            # Only load the full user once the credentials check out
+            user = self.db_service.get_user_by_id(auth_view.id)
+
             # Update last login
             user.last_login = datetime.now(timezone.utc)
             self.db_service.db.session.commit()
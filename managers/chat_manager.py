@@ -1,16 +1,29 @@
-import json
 import openai
+import orjson
 import logging
+import functools
 
 from config import MyConfig
 from typing import Generator
 from database.db_models import Expert
 from services.db_service import DatabaseService
 from services.pinecone_service import PineconeService
+from utils.app_utils import sanitize_namespace
 from flask import jsonify, Response, stream_with_context
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; both the streaming and non-streaming paths format
+# this same template, so keeping a single copy stops the two from drifting.
+# Kept flush-left on purpose — source indentation inside the template would
+# be billed as prompt tokens on every request
+_USER_PROMPT_TEMPLATE = (
+    "Context from podcast episodes:\n"
+    "{context}\n\n"
+    "User question: {message}\n\n"
+    "Answer the question based on the provided context."
+)
+
 
 class ChatManager:
     def __init__(
@@ -31,6 +44,12 @@ class ChatManager:
         self.pinecone_service = pinecone_service
         self.openai_client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
 
+        # The system prompt only depends on the expert name, so memoize it
+        # per instance instead of re-concatenating on every message
+        self.create_system_prompt = functools.lru_cache(maxsize=256)(
+            self.create_system_prompt
+        )
+
     def chat_with_expert(self, data: dict) -> tuple:
         """Handle a non-streaming chat request with an expert.
 
@@ -89,11 +108,11 @@ class ChatManager:
         def generate():
             try:
                 for token in self._generate_response_stream(expert, message):
-                    yield f"data: {json.dumps({'token': token})}\n\n"
-                yield "data: [DONE]\n\n"
+                    yield b"data: " + orjson.dumps({"token": token}) + b"\n\n"
+                yield b"data: [DONE]\n\n"
             except Exception as e:
                 logger.error(f"Error in streaming: {str(e)}")
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield b"data: " + orjson.dumps({"error": str(e)}) + b"\n\n"
 
         return Response(
             stream_with_context(generate()),
@@ -121,7 +140,7 @@ class ChatManager:
                  or an error message if no relevant context is found
         """
         try:
-            namespace = expert.name.lower().replace(" ", "_")
+            namespace = sanitize_namespace(expert.name)
 
             # Query Pinecone for relevant chunks
             chunks = self.pinecone_service.query_knowledge(
@@ -131,17 +150,21 @@ class ChatManager:
             if not chunks:
                 return "No relevant context found."
 
-            # Filter by relevance score and extract context
+            # Filter by relevance score and extract context. Matches arrive
+            # sorted by score, so capping the list keeps the best chunks while
+            # bounding the prompt tokens sent to the LLM
             relevant_chunks = []
             for chunk in chunks:
                 if chunk.get("score", 0) > self.config.PINECONE_SCORE_THRESHOLD:
-                    metadata = chunk.get("metadata", {})
-                    chunk_text = metadata["text"]
-                    episode_title = metadata["episode_title"]
+                    chunk_text = chunk.get("text", "")
+                    episode_title = chunk.get("episode_title", "")
 
                     if chunk_text:
                         relevant_chunks.append(f"From '{episode_title}': {chunk_text}")
 
+                if len(relevant_chunks) >= self.config.CONTEXT_MAX_CHUNKS:
+                    break
+
             if not relevant_chunks:
                 return "No highly relevant context found for your question."
 
@@ -180,12 +203,7 @@ class ChatManager:
             system_prompt = self.create_system_prompt(expert.name)
 
             # Create user prompt with context
-            user_prompt = f"""Context from podcast episodes:
-                    {context}
-
-                    User question: {message}
-
-                    Please answer the question based on the provided context."""
+            user_prompt = _USER_PROMPT_TEMPLATE.format(context=context, message=message)
 
             # Generate response
             response = self.openai_client.chat.completions.create(
@@ -223,12 +241,7 @@ class ChatManager:
             system_prompt = self.create_system_prompt(expert.name)
 
             # Create user prompt with context
-            user_prompt = f"""Context from podcast episodes:
-                    {context}
-
-                    User question: {message}
-
-                    Please answer the question based on the provided context."""
+            user_prompt = _USER_PROMPT_TEMPLATE.format(context=context, message=message)
 
             # Generate streaming response
             stream = self.openai_client.chat.completions.create(
@@ -273,7 +286,7 @@ class ChatManager:
         if not message:
             return False, "Message is required", 400
 
-        if not self.db_service.get_expert_by_id(expert_id):
+        if not self.db_service.expert_exists(expert_id):
             return False, "Expert not found", 404
 
         return True, "", 200
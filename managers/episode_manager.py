@@ -71,13 +71,14 @@ class EpisodeManager:
         Returns:
             tuple: (JSON response, HTTP status code)
                 On success: {"success": True, "data": {"episodes": list[dict]}} with status 200
-                Each episode dict contains the episode's details including id, title, and content
+                Each episode dict contains the episode's list-view details (id, title,
+                timestamps); the transcript content itself is omitted
         """
         db_episodes = self.db_service.get_episodes(expert_id)
         episodes = []
 
         for db_episode in db_episodes:
-            episodes.append(db_episode.to_dict())
+            episodes.append(db_episode.to_dict(include_content=False))
 
         return jsonify({"success": True, "data": {"episodes": episodes}}), 200
 
@@ -106,6 +107,17 @@ class EpisodeManager:
         if not is_valid:
             return jsonify({"success": False, "error": error_message}), 400
 
+        # Compare against the current row before it is overwritten: when
+        # neither the transcript nor the title changed there is nothing to
+        # re-embed, and the Pinecone delete + store cycle can be skipped
+        # entirely (the title matters too — it lives in vector metadata)
+        current_episode = self.db_service.get_episode_by_id(episode_id)
+        vectors_unchanged = (
+            current_episode is not None
+            and current_episode.content == data["content"]
+            and current_episode.title == data["title"]
+        )
+
         # Update episode in database
         episode = self.db_service.update_episode(
             episode_id,
@@ -121,6 +133,9 @@ class EpisodeManager:
                 500,
             )
 
+        if vectors_unchanged:
+            return jsonify({"success": True}), 200
+
         # Update content in Pinecone
         is_deleted = self.pinecone_service.delete_episode(episode_id, db_expert.name)
         if not is_deleted:
@@ -178,7 +193,7 @@ class EpisodeManager:
 
         # Delete from Pinecone first
         is_deleted_from_pinecone = self.pinecone_service.delete_episode(
-            episode_id, expert.name.lower().replace(" ", "_")
+            episode_id, expert.name
         )
 
         if not is_deleted_from_pinecone:
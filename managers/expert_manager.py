@@ -128,15 +128,10 @@ class ExpertManager:
         if not expert:
             return jsonify({"success": False, "error": "Failed to create expert."}), 400
 
-        # Create episodes for this expert
-        stored_episodes = []
-        for episode_data in episodes:
-            db_episode = self.db_service.create_episode(
-                expert_id=expert.id,
-                title=episode_data["title"],
-                content=episode_data["content"],
-            )
-            stored_episodes.append(db_episode)
+        # Create episodes for this expert in a single transaction
+        stored_episodes = self.db_service.create_episodes_bulk(
+            expert.id, valid_episodes
+        )
 
         # Store content in Pinecone
         for db_episode in stored_episodes:
@@ -1,13 +1,106 @@
+import time
 import logging
+import functools
 
-from sqlalchemy import and_, desc, func
+from collections import namedtuple
+from sqlalchemy.orm import defer, joinedload
 from datetime import datetime, timezone
 from typing import List, Optional, Dict
 from sqlalchemy.exc import IntegrityError
 from database.db_models import User, Expert, Episode
+from sqlalchemy import and_, bindparam, desc, func, insert, select
 
 logger = logging.getLogger(__name__)
 
+# Columns callers may overwrite through update_episode; excludes the primary
+# key, the owning expert and the timestamp bookkeeping columns
+_EPISODE_UPDATABLE_COLS = frozenset(c.name for c in Episode.__table__.columns) - {
+    "id",
+    "expert_id",
+    "created_at",
+    "updated_at",
+}
+
+
+def _transactional(fallback=None):
+    """Wrap a mutating DatabaseService method with commit/rollback handling.
+
+    Commits once the wrapped method returns, rolls back and logs on any
+    failure, and returns ``fallback`` instead of raising so callers keep the
+    same soft-failure contract as the read paths. Deduplicates the
+    try/commit/except/rollback boilerplate that every write method carried.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                result = fn(self, *args, **kwargs)
+                self.db.session.commit()
+                return result
+            except IntegrityError as e:
+                # Routine constraint violations (e.g. duplicate expert name)
+                # become ordinary 4xx responses upstream; no traceback needed
+                logger.error("%s failed: integrity error: %s", fn.__name__, e)
+                self.db.session.rollback()
+                return fallback
+            except Exception:
+                logger.exception("%s failed", fn.__name__)
+                self.db.session.rollback()
+                return fallback
+
+        return wrapper
+
+    return decorator
+
+
+# Lightweight snapshot of the columns needed to authenticate a user; cached
+# instead of the ORM instance so entries never go detached across sessions
+UserAuthView = namedtuple("UserAuthView", ["id", "password_hash", "is_active"])
+
+_USER_CACHE_TTL = 10  # seconds
+_USER_CACHE_MAXSIZE = 1024
+
+# Statement shapes reused on every call — built once at import so the
+# expression tree (and its compiled-cache key) isn't reconstructed per query
+_SEL_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_SEL_USER_EMAIL = select(User.email).where(User.id == bindparam("user_id"))
+_SEL_USER_EXPERTS = (
+    select(Expert)
+    .where(Expert.user_id == bindparam("user_id"))
+    .order_by(desc(Expert.created_at))
+)
+_SEL_EXPERT_EXISTS = (
+    select(Expert.id).where(Expert.id == bindparam("expert_id")).limit(1)
+)
+_SEL_EXPERT_OWNED = (
+    select(Expert.id)
+    .where(
+        and_(
+            Expert.id == bindparam("expert_id"),
+            Expert.user_id == bindparam("user_id"),
+        )
+    )
+    .limit(1)
+)
+_SEL_EPISODES_BY_EXPERT = (
+    select(Episode)
+    .options(defer(Episode.content))
+    .where(Episode.expert_id == bindparam("expert_id"))
+    .order_by(desc(Episode.created_at))
+)
+_SEL_EPISODE_CONTENT = select(Episode.content).where(
+    Episode.id == bindparam("episode_id")
+)
+_SEL_USER_EXPERT_COUNT = select(func.count(Expert.id)).where(
+    Expert.user_id == bindparam("user_id")
+)
+_SEL_USER_EPISODE_COUNT = (
+    select(func.count(Episode.id))
+    .join(Expert, Episode.expert_id == Expert.id)
+    .where(Expert.user_id == bindparam("user_id"))
+)
+
 
 class DatabaseService:
     """Service layer for database operations.
@@ -23,6 +116,7 @@ class DatabaseService:
             db: SQLAlchemy database instance
         """
         self.db = db
+        self._user_cache = {}  # username -> (expires_at, UserAuthView)
 
     ########
     # USER #
@@ -37,55 +131,108 @@ class DatabaseService:
             Optional[User]: User object if found, None otherwise
         """
         try:
-            return self.db.session.query(User).filter(User.username == username).first()
+            return self.db.session.execute(
+                _SEL_USER_BY_USERNAME, {"username": username}
+            ).scalar_one_or_none()
+        except Exception as e:
+            logger.error("Error getting user by username: %s", str(e))
+            return None
+
+    def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Retrieve a user by their ID.
+
+        Args:
+            user_id: The ID of the user to retrieve
+
+        Returns:
+            Optional[User]: User object if found, None otherwise
+        """
+        try:
+            return self.db.session.get(User, user_id)
         except Exception as e:
-            logger.error(f"Error getting user by username: {str(e)}")
+            logger.error("Error getting user by ID: %s", str(e))
+            return None
+
+    def get_user_auth_view(self, username: str) -> Optional[UserAuthView]:
+        """Retrieve the authentication fields for a user, with a short-TTL cache.
+
+        The login path only needs id/password_hash/is_active to decide whether
+        to proceed, so those columns are memoized per username for a few
+        seconds to absorb repeated lookups without hitting the database.
+
+        Args:
+            username: The username to look up
+
+        Returns:
+            Optional[UserAuthView]: Cached auth snapshot if the user exists,
+                None otherwise
+        """
+        now = time.monotonic()
+        cached = self._user_cache.get(username)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        user = self.get_user_by_username(username)
+        if user is None:
             return None
 
+        auth_view = UserAuthView(
+            id=user.id,
+            password_hash=user.password_hash,
+            is_active=user.is_active,
+        )
+        if len(self._user_cache) >= _USER_CACHE_MAXSIZE:
+            self._user_cache.clear()
+        self._user_cache[username] = (now + _USER_CACHE_TTL, auth_view)
+        return auth_view
+
     ##########
     # EXPERT #
     ##########
+    @_transactional()
     def create_expert(
         self, user_id: str, expert_name: str, expert_description: str
     ) -> Optional[Expert]:
         """Create a new expert profile.
-        
+
         Args:
             user_id: ID of the user creating the expert
             expert_name: Name for the new expert
             expert_description: Description of the expert
-            
+
         Returns:
             Optional[Expert]: The created Expert object if successful, None otherwise
-            
-        Raises:
-            IntegrityError: If an expert with the same name already exists
+                (including when an expert with the same name already exists)
         """
-        try:
-            expert = Expert(
+        # Core insert skips the unit-of-work flush/identity-map machinery;
+        # RETURNING delivers the server-generated columns with the write
+        row = self.db.session.execute(
+            insert(Expert)
+            .values(
                 user_id=user_id,
                 name=expert_name,
                 description=expert_description,
             )
-
-            self.db.session.add(expert)
-            self.db.session.commit()
-            self.db.session.refresh(expert)
-
-            logger.info(
-                f"Created expert '{expert.name}' for user '{expert.user.email}'"
-            )
-            return expert
-        except IntegrityError:
-            logger.error(
-                f"Error creating expert: Expert with name: '{expert_name}' already exists"
-            )
-            self.db.session.rollback()
-            return None
-        except Exception as e:
-            logger.error(f"Error creating expert: {str(e)}")
-            self.db.session.rollback()
-            return None
+            .returning(Expert.id, Expert.created_at, Expert.updated_at)
+        ).one()
+
+        # Build the result from known inputs plus the RETURNING row
+        # instead of re-selecting the row we just wrote
+        expert = Expert(
+            id=row.id,
+            user_id=user_id,
+            name=expert_name,
+            description=expert_description,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            user_email = self.db.session.execute(
+                _SEL_USER_EMAIL, {"user_id": user_id}
+            ).scalar()
+            logger.info("Created expert '%s' for user '%s'", expert_name, user_email)
+        return expert
 
     def get_user_experts(self, user_id: str) -> List[Expert]:
         """Retrieve all experts belonging to a specific user.
@@ -98,15 +245,34 @@ class DatabaseService:
         """
         try:
             return (
-                self.db.session.query(Expert)
-                .filter(Expert.user_id == user_id)
-                .order_by(desc(Expert.created_at))
+                self.db.session.execute(_SEL_USER_EXPERTS, {"user_id": user_id})
+                .scalars()
                 .all()
             )
         except Exception as e:
-            logger.error(f"Error getting user experts: {str(e)}")
+            logger.error("Error getting user experts: %s", str(e))
             return []
 
+    def expert_exists(self, expert_id: str) -> bool:
+        """Check whether an expert exists without hydrating a full ORM object.
+
+        Args:
+            expert_id: The ID of the expert to check
+
+        Returns:
+            bool: True if the expert exists, False otherwise
+        """
+        try:
+            return (
+                self.db.session.execute(
+                    _SEL_EXPERT_EXISTS, {"expert_id": expert_id}
+                ).scalar()
+                is not None
+            )
+        except Exception as e:
+            logger.error("Error checking expert existence: %s", str(e))
+            return False
+
     def get_expert_by_id(self, expert_id: str) -> Optional[Expert]:
         """Retrieve an expert by their ID.
         
@@ -119,39 +285,34 @@ class DatabaseService:
         try:
             return Expert.query.get(expert_id)
         except Exception as e:
-            logger.error(f"Error getting expert by ID: {str(e)}")
+            logger.error("Error getting expert by ID: %s", str(e))
             return None
 
+    @_transactional(fallback=False)
     def delete_expert(self, expert_id: str, user_id: str) -> bool:
         """Delete an expert profile.
-        
+
         Args:
             expert_id: ID of the expert to delete
             user_id: ID of the user making the request (for authorization)
-            
+
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            expert = (
-                self.db.session.query(Expert)
-                .filter(and_(Expert.id == expert_id, Expert.user_id == user_id))
-                .first()
-            )
+        # Cheap authorization/existence check before hydrating the row
+        owns_expert = self.db.session.execute(
+            _SEL_EXPERT_OWNED, {"expert_id": expert_id, "user_id": user_id}
+        ).scalar()
 
-            if not expert:
-                return False
-
-            self.db.session.delete(expert)
-            self.db.session.commit()
+        if not owns_expert:
+            return False
 
-            logger.info(f"Deleted expert: {expert.name}")
-            return True
+        # ORM delete so the episode delete-orphan cascade still runs
+        expert = self.db.session.get(Expert, expert_id)
+        self.db.session.delete(expert)
 
-        except Exception as e:
-            logger.error(f"Error deleting expert: {str(e)}")
-            self.db.session.rollback()
-            return False
+        logger.info("Deleted expert: %s", expert.name)
+        return True
 
     ###########
     # EPISODE #
@@ -169,22 +330,66 @@ class DatabaseService:
         Returns:
             Optional[Episode]: The created Episode object if successful, None otherwise
         """
-        try:
-            episode = Episode(expert_id=expert_id, title=title, content=content)
+        episodes = self.create_episodes_bulk(
+            expert_id, [{"title": title, "content": content}]
+        )
+        return episodes[0] if episodes else None
 
-            self.db.session.add(episode)
+    def create_episodes_bulk(self, expert_id: str, items: List[Dict]) -> List[Episode]:
+        """Create multiple episodes for an expert in a single transaction.
+
+        Inserts all rows with one executemany-style INSERT and a single commit,
+        avoiding one transaction (and WAL fsync) per episode on bulk ingests.
+
+        Args:
+            expert_id: ID of the expert the episodes belong to
+            items: List of dicts, each with "title" and "content" keys
+
+        Returns:
+            List[Episode]: The created Episode objects, empty list on failure
+        """
+        try:
+            rows = [
+                {
+                    "expert_id": expert_id,
+                    "title": item["title"],
+                    "content": item["content"],
+                }
+                for item in items
+            ]
+
+            episode_ids = (
+                self.db.session.execute(insert(Episode).returning(Episode.id), rows)
+                .scalars()
+                .all()
+            )
             self.db.session.commit()
-            self.db.session.refresh(episode)
 
-            logger.info(
-                f"Created episode '{episode.title}' for expert '{episode.expert.name}'"
+            # Eagerly load the expert relationship for callers (and log lines)
+            # that access it after the commit
+            episodes = (
+                self.db.session.execute(
+                    select(Episode)
+                    .options(joinedload(Episode.expert))
+                    .where(Episode.id.in_(episode_ids))
+                )
+                .scalars()
+                .all()
             )
-            return episode
+
+            if logger.isEnabledFor(logging.INFO):
+                for episode in episodes:
+                    logger.info(
+                        "Created episode '%s' for expert '%s'",
+                        episode.title,
+                        episode.expert.name,
+                    )
+            return episodes
 
         except Exception as e:
-            logger.error(f"Error creating episode: {str(e)}")
+            logger.error("Error creating episodes: %s", str(e))
             self.db.session.rollback()
-            return None
+            return []
 
     def get_episodes(self, expert_id: str) -> List[Episode]:
         """Retrieve all episodes for a specific expert.
@@ -194,18 +399,40 @@ class DatabaseService:
             
         Returns:
             List[Episode]: List of Episode objects, ordered by creation date (newest first)
+
+        Note:
+            The large `content` column is deferred since list views only need
+            title/id/timestamps. Use get_episode_content() to fetch the transcript.
         """
         try:
             return (
-                self.db.session.query(Episode)
-                .filter(Episode.expert_id == expert_id)
-                .order_by(desc(Episode.created_at))
+                self.db.session.execute(
+                    _SEL_EPISODES_BY_EXPERT, {"expert_id": expert_id}
+                )
+                .scalars()
                 .all()
             )
         except Exception as e:
-            logger.error(f"Error getting expert episodes: {str(e)}")
+            logger.error("Error getting expert episodes: %s", str(e))
             return []
 
+    def get_episode_content(self, episode_id: str) -> Optional[str]:
+        """Retrieve only the content column for a specific episode.
+
+        Args:
+            episode_id: The ID of the episode whose content to retrieve
+
+        Returns:
+            Optional[str]: Episode content if found, None otherwise
+        """
+        try:
+            return self.db.session.execute(
+                _SEL_EPISODE_CONTENT, {"episode_id": episode_id}
+            ).scalar_one_or_none()
+        except Exception as e:
+            logger.error("Error getting episode content: %s", str(e))
+            return None
+
     def get_episode_by_id(self, episode_id: str) -> Optional[Episode]:
         """Retrieve an episode by its ID.
         
@@ -218,41 +445,35 @@ class DatabaseService:
         try:
             return Episode.query.get(episode_id)
         except Exception as e:
-            logger.error(f"Error getting episode by ID: {str(e)}")
+            logger.error("Error getting episode by ID: %s", str(e))
             return None
 
+    @_transactional()
     def update_episode(self, episode_id: str, **kwargs) -> Optional[Episode]:
         """Update an existing episode's information.
-        
+
         Args:
             episode_id: ID of the episode to update
             **kwargs: Key-value pairs of fields to update
-            
+
         Returns:
             Optional[Episode]: The updated Episode object if successful, None otherwise
         """
-        try:
-            episode = self.get_episode_by_id(episode_id)
+        episode = self.get_episode_by_id(episode_id)
 
-            if not episode:
-                return None
+        if not episode:
+            return None
 
-            for key, value in kwargs.items():
-                if hasattr(episode, key):
-                    setattr(episode, key, value)
+        for key, value in kwargs.items():
+            if key in _EPISODE_UPDATABLE_COLS:
+                setattr(episode, key, value)
 
-            episode.updated_at = datetime.now(timezone.utc)
-            self.db.session.commit()
-            self.db.session.refresh(episode)
+        episode.updated_at = datetime.now(timezone.utc)
 
-            logger.info(f"Updated episode: {episode.title}")
-            return episode
-
-        except Exception as e:
-            logger.error(f"Error updating episode: {str(e)}")
-            self.db.session.rollback()
-            return None
+        logger.info("Updated episode: %s", episode.title)
+        return episode
 
+    @_transactional(fallback=False)
     def delete_episode(self, episode_id: str) -> bool:
         """Permanently delete an episode.
         
@@ -262,21 +483,14 @@ class DatabaseService:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            episode = self.get_episode_by_id(episode_id)
-            if not episode:
-                return False
-
-            self.db.session.delete(episode)
-            self.db.session.commit()
-            logger.info(f"Deleted episode: {episode.title}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Error deleting episode: {str(e)}")
-            self.db.session.rollback()
+        episode = self.get_episode_by_id(episode_id)
+        if not episode:
             return False
 
+        self.db.session.delete(episode)
+        logger.info("Deleted episode: %s", episode.title)
+        return True
+
     #########
     # STATS #
     #########
@@ -293,19 +507,14 @@ class DatabaseService:
         """
         try:
             # Get total experts count
-            total_experts = (
-                self.db.session.query(func.count(Expert.id))
-                .filter(Expert.user_id == user_id)
-                .scalar()
-            )
+            total_experts = self.db.session.execute(
+                _SEL_USER_EXPERT_COUNT, {"user_id": user_id}
+            ).scalar()
 
             # Get total episodes count
-            total_episodes = (
-                self.db.session.query(func.count(Episode.id))
-                .join(Expert, Episode.expert_id == Expert.id)
-                .filter(Expert.user_id == user_id)
-                .scalar()
-            )
+            total_episodes = self.db.session.execute(
+                _SEL_USER_EPISODE_COUNT, {"user_id": user_id}
+            ).scalar()
 
             return {
                 "total_experts": total_experts or 0,
@@ -313,7 +522,7 @@ class DatabaseService:
             }
 
         except Exception as e:
-            logger.error(f"Error getting user stats: {str(e)}")
+            logger.error("Error getting user stats: %s", str(e))
             return {
                 "total_experts": 0,
                 "total_episodes": 0,
@@ -1,18 +1,27 @@
 import os
+import openai
 import logging
+import hashlib
+import functools
 
 from config import MyConfig
 from dotenv import load_dotenv
 from typing import List, Dict, Any
 from database.db_models import Episode
+from services.db_service import DatabaseService
 from pinecone import Pinecone, ServerlessSpec
-from langchain_openai import OpenAIEmbeddings
+from services.semantic_cache import SemanticQueryCache
+from utils.app_utils import sanitize_namespace
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 
 load_dotenv(override=True)
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of index names per API key so repeated service
+# instantiations skip the control-plane list_indexes round-trip
+_KNOWN_INDEXES: Dict[str, set] = {}
+
 
 class PineconeService:
     """Service for managing vector database operations with Pinecone.
@@ -23,32 +32,55 @@ class PineconeService:
     
     Attributes:
         config: Application configuration object
+        db_service: Service used to fetch episode transcripts for chunk lookup
         pc: Pinecone client instance
         index_name: Name of the Pinecone index
-        embeddings: OpenAI embeddings model instance
+        openai_client: OpenAI client used for embedding calls
         text_splitter: Text splitter for chunking content
     """
 
-    def __init__(self, config: MyConfig):
+    def __init__(self, config: MyConfig, db_service: DatabaseService):
         """Initialize the PineconeService with configuration.
         
         Args:
             config: Application configuration object containing API keys and settings
+            db_service: Service for database operations
             
         Initializes the Pinecone client, embeddings model, and ensures the index exists.
         """
         self.config = config
+        self.db_service = db_service
         self.pc = Pinecone(api_key=self.config.PINECONE_API_KEY)
         self.index_name = self.config.PINECONE_INDEX_NAME
-        self.embeddings = OpenAIEmbeddings(
-            model=self.config.OPENAI_EMBEDDINGS_MODEL,
-            openai_api_key=self.config.OPENAI_API_KEY,
+        self.openai_client = openai.OpenAI(api_key=self.config.OPENAI_API_KEY)
+        self.embeddings_model = self.config.OPENAI_EMBEDDINGS_MODEL
+        # Token-measured splitting sized for the embedding model's input
+        # window; character-based 1000-char chunks over-split dense text
+        self.text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            model_name=self.config.OPENAI_EMBEDDINGS_MODEL,
+            chunk_size=self.config.TEXT_CHUNK_SIZE,
+            chunk_overlap=self.config.TEXT_CHUNK_OVERLAP,
+            separators=["\n\n", "\n", ". ", " ", ""],
         )
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000, chunk_overlap=100, separators=["\n\n", "\n", ". ", " ", ""]
+        self._chunk_cache = {}  # episode_id -> list of chunk texts
+        self._content_cache = {}  # episode_id -> prefixed transcript
+
+        # Repeat questions (retries, edits resubmitted verbatim) skip the
+        # embedding API round-trip entirely via an exact-string LRU
+        self._embed_query = functools.lru_cache(maxsize=1024)(self._embed_query)
+        self.query_cache = SemanticQueryCache(
+            maxsize=self.config.SEMANTIC_CACHE_MAXSIZE,
+            ttl=self.config.SEMANTIC_CACHE_TTL,
+            threshold=self.config.SEMANTIC_CACHE_THRESHOLD,
         )
         self._ensure_index_exists()
 
+        # Single pooled handle reused by every operation; constructing one per
+        # call rebuilds host discovery and the HTTP connection pool each time
+        self._index = self.pc.Index(
+            self.index_name, pool_threads=self.config.PINECONE_POOL_THREADS
+        )
+
     def _ensure_index_exists(self):
         """Ensure the Pinecone index exists, create it if it doesn't.
         
@@ -59,7 +91,12 @@ class PineconeService:
             Exception: If there's an error creating the index
         """
         try:
-            if self.index_name not in self.pc.list_indexes().names():
+            known_indexes = _KNOWN_INDEXES.get(self.config.PINECONE_API_KEY)
+            if known_indexes is None:
+                known_indexes = set(self.pc.list_indexes().names())
+                _KNOWN_INDEXES[self.config.PINECONE_API_KEY] = known_indexes
+
+            if self.index_name not in known_indexes:
                 logger.info(f"Creating Pinecone index: {self.index_name}")
                 self.pc.create_index(
                     name=self.index_name,
@@ -70,11 +107,41 @@ class PineconeService:
                         region=os.getenv("PINECONE_REGION", "us-east-1"),
                     ),
                 )
+                known_indexes.add(self.index_name)
                 logger.info(f"Successfully created index: {self.index_name}")
         except Exception as e:
             logger.error(f"Error ensuring index exists: {str(e)}")
             raise
 
+    def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for a batch of texts via the OpenAI API.
+
+        Calls the openai client directly rather than going through LangChain's
+        OpenAIEmbeddings wrapper, skipping its per-call validation, pydantic
+        construction and tiktoken pre-chunking overhead.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List[List[float]]: One embedding per input text, in order
+        """
+        response = self.openai_client.embeddings.create(
+            model=self.embeddings_model, input=texts
+        )
+        return [item.embedding for item in response.data]
+
+    def _embed_query(self, text: str) -> List[float]:
+        """Generate an embedding for a single query string.
+
+        Args:
+            text: Query text to embed
+
+        Returns:
+            List[float]: The query embedding
+        """
+        return self._embed_documents([text])[0]
+
     def store_episode_content(
         self,
         episode: Episode,
@@ -91,13 +158,37 @@ class PineconeService:
 
         Returns:
             bool: True if storage was successful, False otherwise
-            
+
         Note:
-            The content is split into chunks of 1000 characters with 100 character
-            overlap between chunks for better context retention.
+            The content is split into chunks of TEXT_CHUNK_SIZE tokens with
+            TEXT_CHUNK_OVERLAP tokens of overlap for context retention. Embedding happens
+            in sub-batches of OPENAI_EMBEDDINGS_CHUNK_SIZE chunks interleaved with
+            async upserts, so Pinecone I/O overlaps the next embedding request.
         """
         try:
-            index = self.pc.Index(self.index_name)
+            index = self._index
+            namespace = sanitize_namespace(db_expert_name)
+
+            # Skip the whole embed/upsert run when the stored vectors were
+            # built from identical content (idempotent re-ingests). The title
+            # is part of the comparison because it lives in vector metadata:
+            # a title-only change must re-store, both to refresh the metadata
+            # and because the fetch may still see just-deleted vectors under
+            # Pinecone's eventual consistency
+            content_hash = hashlib.sha256(episode.content.encode()).hexdigest()
+            first_chunk_id = f"{episode.id}_chunk_0"
+            existing = index.fetch(ids=[first_chunk_id], namespace=namespace)
+            existing_vector = existing.vectors.get(first_chunk_id)
+            if (
+                existing_vector is not None
+                and existing_vector.metadata
+                and existing_vector.metadata.get("content_hash") == content_hash
+                and existing_vector.metadata.get("episode_title") == episode.title
+            ):
+                logger.info(
+                    f"Content unchanged for episode {episode.title}; skipping re-embedding"
+                )
+                return True
 
             # Combine content for better context
             full_content = f"Content: {episode.content}"
@@ -105,30 +196,83 @@ class PineconeService:
             # Split content into chunks
             chunks = self.text_splitter.split_text(full_content)
 
-            # Generate embeddings
-            embeddings = self.embeddings.embed_documents(chunks)
-
-            # Prepare vectors for upsert
-            vectors = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                vector_id = f"{episode.id}_chunk_{i}"
-                vector_metadata = {
-                    "episode_id": str(episode.id),
-                    "episode_title": episode.title,
-                    "chunk_index": i,
-                    "text": chunk,
-                }
-                vectors.append(
-                    {"id": vector_id, "values": embedding, "metadata": vector_metadata}
-                )
-
-            # Upsert vectors to Pinecone
-            index.upsert(
-                vectors=vectors, namespace=db_expert_name.lower().replace(" ", "_")
-            )
+            # Record each chunk's character span within the stored transcript;
+            # the query path slices these spans back out of the database row,
+            # so retrieval stays correct even if the splitter configuration
+            # changes after ingest. Chunks are contiguous substrings (overlap
+            # only moves the start backwards), so a forward find suffices.
+            chunk_offsets = []
+            search_from = 0
+            for chunk in chunks:
+                chunk_start = full_content.find(chunk, search_from)
+                if chunk_start == -1:
+                    chunk_start = full_content.find(chunk)
+                chunk_offsets.append((chunk_start, chunk_start + len(chunk)))
+                search_from = chunk_start + 1
+
+            embeddings_chunk_size = self.config.OPENAI_EMBEDDINGS_CHUNK_SIZE
+            upsert_batch_size = self.config.PINECONE_UPSERT_BATCH_SIZE
+
+            total_vectors = 0
+            async_results = []
+            for start in range(0, len(chunks), embeddings_chunk_size):
+                chunk_batch = chunks[start : start + embeddings_chunk_size]
+
+                # Embed one sub-batch at a time so a huge transcript never
+                # exceeds OpenAI's per-request token ceiling
+                embeddings = self._embed_documents(chunk_batch)
+
+                # Prepare vectors for upsert
+                vectors = []
+                for i, (chunk, embedding) in enumerate(
+                    zip(chunk_batch, embeddings), start=start
+                ):
+                    # The chunk text itself stays out of the metadata payload;
+                    # its character span is enough to recover it from the
+                    # transcript in the database at query time
+                    vector_id = f"{episode.id}_chunk_{i}"
+                    chunk_start, chunk_end = chunk_offsets[i]
+                    vector_metadata = {
+                        "episode_id": str(episode.id),
+                        "episode_title": episode.title,
+                        "chunk_index": i,
+                        "chunk_start": chunk_start,
+                        "chunk_end": chunk_end,
+                    }
+                    if i == 0:
+                        # Only the first chunk carries the hash; it's the one
+                        # the short-circuit check above fetches
+                        vector_metadata["content_hash"] = content_hash
+                    vectors.append(
+                        {
+                            "id": vector_id,
+                            "values": embedding,
+                            "metadata": vector_metadata,
+                        }
+                    )
+
+                # Fan the upsert out over the client's thread pool while the
+                # next embedding batch is in flight
+                for i in range(0, len(vectors), upsert_batch_size):
+                    async_results.append(
+                        index.upsert(
+                            vectors=vectors[i : i + upsert_batch_size],
+                            namespace=namespace,
+                            async_req=True,
+                        )
+                    )
+                total_vectors += len(vectors)
+
+            # Wait for all in-flight upserts to finish
+            for async_result in async_results:
+                async_result.get()
+
+            self._cache_chunk_texts(str(episode.id), chunks)
+            self._cache_episode_content(str(episode.id), full_content)
+            self.query_cache.invalidate_namespace(namespace)
 
             logger.info(
-                f"Successfully stored {len(vectors)} chunks for episode {episode.title} in namespace {db_expert_name.lower().replace(' ', '_')}"
+                f"Successfully stored {total_vectors} chunks for episode {episode.title} in namespace {namespace}"
             )
             return True
 
@@ -136,6 +280,72 @@ class PineconeService:
             logger.error(f"Error storing episode content: {str(e)}")
             return False
 
+    def _cache_chunk_texts(self, episode_id: str, chunk_texts: List[str]):
+        """Cache the chunk texts of an episode, bounding the cache size.
+
+        Args:
+            episode_id: ID of the episode the chunks belong to
+            chunk_texts: Ordered list of the episode's chunk texts
+        """
+        if len(self._chunk_cache) >= 256:
+            self._chunk_cache.clear()
+        self._chunk_cache[episode_id] = chunk_texts
+
+    def _cache_episode_content(self, episode_id: str, full_content: str):
+        """Cache an episode's prefixed transcript, bounding the cache size.
+
+        Args:
+            episode_id: ID of the episode the transcript belongs to
+            full_content: The transcript with the "Content: " ingest prefix
+        """
+        if len(self._content_cache) >= 256:
+            self._content_cache.clear()
+        self._content_cache[episode_id] = full_content
+
+    def _resolve_chunk_text(self, metadata: Dict[str, Any]) -> str:
+        """Resolve a match's chunk text from its vector metadata.
+
+        Tried in order: the inline "text" key (vectors ingested before the
+        metadata slimming still carry one), the chunk lists cached at ingest
+        time, and finally the character span stored with each vector, which
+        slices the exact embedded text out of the transcript in the database
+        regardless of the current splitter configuration.
+
+        Args:
+            metadata: Metadata dict of a Pinecone match
+
+        Returns:
+            str: The chunk text, or an empty string if it can't be resolved
+        """
+        text = metadata.get("text")
+        if text is not None:
+            return text
+
+        episode_id = metadata.get("episode_id", "")
+        chunk_index = int(metadata.get("chunk_index", -1))
+        chunk_texts = self._chunk_cache.get(episode_id)
+        if chunk_texts is not None and 0 <= chunk_index < len(chunk_texts):
+            return chunk_texts[chunk_index]
+
+        chunk_start = metadata.get("chunk_start")
+        chunk_end = metadata.get("chunk_end")
+        if chunk_start is None or chunk_end is None:
+            return ""
+
+        # Each transcript is read from the database at most once per process;
+        # matches for the same episode within one query (and across later
+        # queries) slice the cached copy
+        full_content = self._content_cache.get(episode_id)
+        if full_content is None:
+            content = self.db_service.get_episode_content(episode_id)
+            if content is None:
+                return ""
+            full_content = f"Content: {content}"
+            self._cache_episode_content(episode_id, full_content)
+
+        # Pinecone returns numeric metadata as floats
+        return full_content[int(chunk_start) : int(chunk_end)]
+
     def query_knowledge(
         self, query: str, namespace: str, include_metadata: bool = True
     ) -> List[Dict[str, Any]]:
@@ -161,10 +371,19 @@ class PineconeService:
             The number of results is limited by PINECONE_TOP_K configuration.
         """
         try:
-            index = self.pc.Index(self.index_name)
+            index = self._index
 
             # Generate query embedding
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self._embed_query(query)
+
+            # Serve paraphrased repeats of recent queries from the in-process
+            # semantic cache instead of round-tripping to Pinecone
+            cached_chunks = self.query_cache.get(namespace, query_embedding)
+            if cached_chunks is not None:
+                logger.info(
+                    f"Semantic cache hit for query in namespace {namespace}"
+                )
+                return cached_chunks
 
             # Search Pinecone
             results = index.query(
@@ -174,18 +393,21 @@ class PineconeService:
                 namespace=namespace,
             )
 
-            # Extract and format results
-            relevant_chunks = []
-            for match in results.matches:
-                relevant_chunks.append(
-                    {
-                        "text": match.metadata.get("text", ""),
-                        "score": match.score,
-                        "episode_title": match.metadata.get("episode_title", ""),
-                        "episode_id": match.metadata.get("episode_id", ""),
-                        "metadata": match.metadata,
-                    }
-                )
+            # Extract and format results, resolving chunk text from the
+            # metadata (inline text, ingest cache or stored character span);
+            # the walrus binds each match's metadata attribute exactly once
+            relevant_chunks = [
+                {
+                    "text": self._resolve_chunk_text(metadata := match.metadata),
+                    "score": match.score,
+                    "episode_title": metadata.get("episode_title", ""),
+                    "episode_id": metadata.get("episode_id", ""),
+                    "metadata": metadata,
+                }
+                for match in results.matches
+            ]
+
+            self.query_cache.put(namespace, query_embedding, relevant_chunks)
 
             logger.info(
                 f"Found {len(relevant_chunks)} relevant chunks for query in namespace {namespace}"
@@ -196,42 +418,41 @@ class PineconeService:
             logger.error(f"Error querying knowledge base: {str(e)}")
             return []
 
-    def delete_episode(self, episode_id: str, namespace: str) -> bool:
+    def delete_episode(self, episode_id: str, db_expert_name: str) -> bool:
         """Delete all vector embeddings for a specific episode.
-        
+
         Args:
             episode_id: Unique identifier of the episode to delete
-            namespace: Pinecone namespace where the episode is stored
-            
+            db_expert_name: Name of the expert (used as Pinecone namespace)
+
         Returns:
             bool: True if deletion was successful, False otherwise
-            
+
         Note:
-            This performs a query to find all vectors associated with the episode
-            and then deletes them in a batch operation.
+            Vector IDs follow the "<episode_id>_chunk_<i>" naming scheme, so an
+            ID-prefix listing enumerates exactly this episode's vectors without
+            a similarity-query scan (serverless indexes don't support
+            metadata-filtered deletes).
         """
         try:
-            index = self.pc.Index(self.index_name)
-
-            # Query to find all vectors for this episode
-            results = index.query(
-                vector=[0] * int(self.config.PINECONE_DIMENSION),
-                top_k=10000,  # Large number to get all chunks
-                include_metadata=True,
-                namespace=namespace,
-                filter={"episode_id": episode_id},
-            )
+            index = self._index
+            namespace = sanitize_namespace(db_expert_name)
 
-            # Extract vector IDs
-            vector_ids = [match.id for match in results.matches]
+            deleted_count = 0
+            for id_batch in index.list(
+                prefix=f"{episode_id}_chunk_", namespace=namespace
+            ):
+                index.delete(ids=id_batch, namespace=namespace)
+                deleted_count += len(id_batch)
 
-            if vector_ids:
-                # Delete vectors
-                index.delete(ids=vector_ids, namespace=namespace)
+            if deleted_count:
                 logger.info(
-                    f"Deleted {len(vector_ids)} vectors for episode {episode_id}"
+                    f"Deleted {deleted_count} vectors for episode {episode_id}"
                 )
 
+            self._chunk_cache.pop(episode_id, None)
+            self._content_cache.pop(episode_id, None)
+            self.query_cache.invalidate_namespace(namespace)
             return True
 
         except Exception as e:
@@ -252,9 +473,11 @@ class PineconeService:
             Use with caution as this operation cannot be undone.
         """
         try:
-            index = self.pc.Index(self.index_name)
-            index.delete(delete_all=True, namespace=namespace.lower().replace(" ", "_"))
-            logger.info(f"Deleted namespace: {namespace.lower().replace(' ', '_')}")
+            index = self._index
+            namespace_slug = sanitize_namespace(namespace)
+            index.delete(delete_all=True, namespace=namespace_slug)
+            self.query_cache.invalidate_namespace(namespace_slug)
+            logger.info(f"Deleted namespace: {namespace_slug}")
             return True
 
         except Exception as e:
@@ -0,0 +1,137 @@
+import time
+import logging
+import threading
+
+import numpy as np
+
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticQueryCache:
+    """In-process semantic cache for vector search results.
+
+    Stores the L2-normalized embeddings of past queries alongside the results
+    they produced. A lookup computes cosine similarity against every cached
+    embedding with a single matrix-vector product; any entry scoring at or
+    above the configured threshold is treated as a paraphrase of the incoming
+    query and its results are returned without a Pinecone round-trip.
+
+    Attributes:
+        maxsize: Maximum number of cached entries (oldest evicted first)
+        ttl: Seconds a cached entry stays valid
+        threshold: Minimum cosine similarity for a cache hit
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 300, threshold: float = 0.95):
+        """Initialize the SemanticQueryCache.
+
+        Args:
+            maxsize: Maximum number of cached entries
+            ttl: Time-to-live for cached entries, in seconds
+            threshold: Minimum cosine similarity to count as a hit
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None  # (N, d) float32, unit-norm
+        self._entries: List[tuple] = []  # parallel (namespace, expires_at, results)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-norm float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, namespace: str, query_embedding: List[float]) -> Optional[Any]:
+        """Look up cached results for a semantically similar query.
+
+        Args:
+            namespace: Namespace the query was issued against
+            query_embedding: Embedding of the incoming query
+
+        Returns:
+            Optional[Any]: Cached results if a similar-enough query from the
+                same namespace is still fresh, None otherwise
+        """
+        query_vector = self._normalize(query_embedding)
+
+        with self._lock:
+            if self._embeddings is None or not self._entries:
+                return None
+
+            # One BLAS-backed matrix-vector product covers all entries
+            similarities = self._embeddings @ query_vector
+
+            now = time.monotonic()
+            best_index = -1
+            best_similarity = self.threshold
+            for i, (entry_namespace, expires_at, _) in enumerate(self._entries):
+                if entry_namespace != namespace or expires_at <= now:
+                    continue
+                if similarities[i] >= best_similarity:
+                    best_similarity = similarities[i]
+                    best_index = i
+
+            if best_index < 0:
+                return None
+            return self._entries[best_index][2]
+
+    def put(
+        self, namespace: str, query_embedding: List[float], results: Any
+    ) -> None:
+        """Cache the results produced for a query embedding.
+
+        Args:
+            namespace: Namespace the query was issued against
+            query_embedding: Embedding of the query
+            results: Results to serve for similar future queries
+        """
+        query_vector = self._normalize(query_embedding)
+
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = query_vector[np.newaxis, :]
+            else:
+                self._embeddings = np.vstack([self._embeddings, query_vector])
+            self._entries.append((namespace, time.monotonic() + self.ttl, results))
+
+            # Evict oldest entries once over capacity
+            if len(self._entries) > self.maxsize:
+                overflow = len(self._entries) - self.maxsize
+                self._embeddings = self._embeddings[overflow:]
+                del self._entries[:overflow]
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop all cached entries for a namespace.
+
+        Called when the underlying vectors change (episode stored, updated or
+        deleted) so the cache never serves stale chunks.
+
+        Args:
+            namespace: Namespace whose entries should be evicted
+        """
+        with self._lock:
+            if not self._entries:
+                return
+
+            keep = [
+                i
+                for i, (entry_namespace, _, _) in enumerate(self._entries)
+                if entry_namespace != namespace
+            ]
+            if len(keep) == len(self._entries):
+                return
+
+            self._entries = [self._entries[i] for i in keep]
+            self._embeddings = self._embeddings[keep] if keep else None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._embeddings = None
+            self._entries.clear()
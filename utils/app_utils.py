@@ -1,10 +1,40 @@
 import logging
 
 from config import MyConfig
+from functools import lru_cache
+
+# Precomputed table for the namespace slug rule (spaces become underscores)
+_NAMESPACE_TRANSLATION = str.maketrans({" ": "_"})
+
+
+@lru_cache(maxsize=1024)
+def sanitize_namespace(expert_name: str) -> str:
+    """Return the Pinecone namespace slug for an expert name.
+
+    Lowercases the name and replaces spaces with underscores. Memoized since
+    the same expert names recur on every store/query/delete call, and
+    centralized so the slug rule can't diverge between call sites.
+
+    Args:
+        expert_name: Display name of the expert
+
+    Returns:
+        str: Sanitized namespace string
+    """
+    return expert_name.lower().translate(_NAMESPACE_TRANSLATION)
+
+
+# Guards setup_logging so repeated calls (multiple entry points, app factory
+# re-invocation under the debug reloader) can't stack duplicate handlers
+_LOGGING_CONFIGURED = False
 
 
 def setup_logging(config: MyConfig):
-    """Setup application logging"""
+    """Setup application logging (idempotent)"""
+    global _LOGGING_CONFIGURED
+
+    if _LOGGING_CONFIGURED:
+        return
 
     # Configure root logger
     logging.basicConfig(
@@ -12,5 +42,6 @@ def setup_logging(config: MyConfig):
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    _LOGGING_CONFIGURED = True
     logger = logging.getLogger(__name__)
     logger.info("Logging configured successfully")